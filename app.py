@@ -1,25 +1,254 @@
 import streamlit as st
-import plotly.express as px
 import plotly.graph_objects as go
 import yfinance as yf
-from streamlit_autorefresh import st_autorefresh
 from data_sources import (
     fetch_comex, 
     fetch_mcx_intraday,
-    get_live_market_news
+    get_live_market_news,
+    convert_to_inr
 )
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 # Page configuration
 st.set_page_config(page_title="Market Charts", layout="wide", page_icon="📊")
 
-# Auto-refresh every 30 seconds (30000 milliseconds)
-# Returns the number of times the app has refreshed
-count = st_autorefresh(interval=30000, limit=None, key="data_refresh")
+# Time range dropdown: label -> (yfinance period, interval), shared by every chart
+# 1D pulls 5 days so there is a previous session even on weekends; the tile keeps the last one
+PERIOD_LABELS = ("1D", "1W", "1M", "3M", "6M", "1Y", "3Y", "5Y", "Max")
+PERIOD_PARAMS = (
+    ("5d", "5m"), ("5d", "15m"), ("1mo", "1h"), ("3mo", "1d"), ("6mo", "1d"),
+    ("1y", "1d"), ("3y", "1wk"), ("5y", "1wk"), ("max", "1mo"),
+)
+PERIOD_INDEX = {label: i for i, label in enumerate(PERIOD_LABELS)}
+
+def history_params(selected_period):
+    """(period, interval) requested from Yahoo for a time range label"""
+    return PERIOD_PARAMS[PERIOD_INDEX[selected_period]]
+
+# Chart layouts shared by every tile, built once instead of per update_layout call
+LAYOUT_BASE = dict(
+    height=200,  # Mobile-optimized height
+    margin=dict(l=0, r=0, t=0, b=0),
+    xaxis=dict(title=""),
+    hovermode='x unified',
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(size=10)  # Smaller font for mobile
+)
+LAYOUT_USD = {**LAYOUT_BASE, 'yaxis': dict(title="Price ($)")}
+LAYOUT_INR = {**LAYOUT_BASE, 'yaxis': dict(title="Price (₹)")}
+
+# (line, fill) colors and hover text per chart, also built once
+GREEN = ("rgba(0, 200, 83, 1)", "rgba(0, 200, 83, 0.2)")
+RED = ("rgba(255, 71, 87, 1)", "rgba(255, 71, 87, 0.2)")
+HOVER_TEMPLATES = {
+    "$": '<b>Price</b>: $%{y:.2f}<br><b>Time</b>: %{x}<extra></extra>',
+    "₹": '<b>Price</b>: ₹%{y:,.0f}<br><b>Time</b>: %{x}<extra></extra>',
+}
+
+def build_area_chart(df, layout, currency, price_format, is_positive, d_low, d_high, prev_close=None):
+    """Close price area chart on a shared layout, with an optional previous close line"""
+    # Set color based on positive/negative
+    line_color, fill_color = GREEN if is_positive else RED
+
+    # Auto-adjust Y-axis with 10% padding on each side of the period's low/high
+    y_padding = (d_high - d_low) * 0.1
+    layout = {
+        **layout,
+        'yaxis': {**layout['yaxis'], 'range': [d_low - y_padding, d_high + y_padding], 'fixedrange': False}
+    }
+
+    if prev_close is not None:
+        layout = {
+            **layout,
+            'shapes': [dict(
+                type='line', xref='paper', x0=0, x1=1, y0=prev_close, y1=prev_close,
+                line=dict(color='gray', dash='dot', width=1), opacity=0.5
+            )],
+            'annotations': [dict(
+                xref='paper', x=1, y=prev_close, xanchor='right', yanchor='bottom',
+                text=f"Prev: {currency}{prev_close:{price_format}}", showarrow=False, font=dict(size=9)
+            )]
+        }
+
+    fig = go.Figure(
+        go.Scatter(
+            x=df.index,
+            y=df["Close"],
+            mode="lines",
+            fill="tozeroy",
+            line_color=line_color,
+            fillcolor=fill_color,
+            hovertemplate=HOVER_TEMPLATES[currency]
+        ),
+        layout=layout
+    )
+    return fig
+
+def reuse_chart(state_key, fingerprint, *chart_args):
+    """build_area_chart(*chart_args), kept in session_state until the tile's fingerprint changes"""
+    cached = st.session_state.get(state_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    fig = build_area_chart(*chart_args)
+    st.session_state[state_key] = (fingerprint, fig)
+    return fig
+
+# Tiles rerun every TILE_REFRESH seconds. The price caches expire a little sooner, so each
+# timed rerun fetches fresh data (tiles firing together still share one download) and a tile
+# is never more than one refresh interval old, rather than up to two stacked windows.
+TILE_REFRESH = 30
+PRICE_TTL = TILE_REFRESH - 5
+
+@st.cache_data(ttl=PRICE_TTL, show_spinner=False)
+def fetch_batch(symbols, period, interval, refresh=0):
+    """Yahoo price history for several symbols in one request, shared within the refresh window"""
+    return yf.download(
+        list(symbols), period=period, interval=interval,
+        group_by='ticker', auto_adjust=True, threads=True, progress=False
+    )
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_news(refresh=0):
+    """Market news, shared by every session within the news refresh window"""
+    return get_live_market_news()
+
+def refresh_token():
+    """This session's Refresh salt: part of every cache key, so a click only bypasses its own entries"""
+    return st.session_state.get("refresh_token", 0)
+
+def group_batches(selections):
+    """Group (symbol, time range label) pairs into one symbol tuple per (period, interval)"""
+    batches = {}
+    for symbol, selected_period in selections:
+        batches.setdefault(history_params(selected_period), []).append(symbol)
+    # Sorted so both sections build the same key for the same symbols and share the download
+    return {params: tuple(sorted(symbols)) for params, symbols in batches.items()}
+
+def fetch_history(symbol, period, interval, batch=(), refresh=0):
+    """One symbol's price history indexed by time, sliced out of the batched download it belongs to"""
+    combined = fetch_batch(batch or (symbol,), period, interval, refresh)
+    if isinstance(combined.columns, pd.MultiIndex):
+        if symbol not in combined.columns.get_level_values(0):
+            return pd.DataFrame()
+        combined = combined[symbol]
+    # Symbols share the batch's time index, so drop rows this one has no data for
+    return combined.dropna(how='all')
+
+@st.cache_data(ttl=PRICE_TTL, show_spinner=False)
+def fetch_inr(yahoo_symbol, commodity, period, interval, batch=(), refresh=0):
+    """Yahoo price history converted to MCX INR units, cached as one unit"""
+    df = fetch_history(yahoo_symbol, period, interval, batch, refresh)
+    if df.empty:
+        return df
+    return convert_to_inr(df, commodity)
+
+def section_batches(section_commodities, key_prefix):
+    """Batch a section's (tile symbol, Yahoo symbol) pairs by the range each tile has selected"""
+    # The selectbox value is already updated when a new range triggers the rerun
+    return group_batches(
+        (yahoo_symbol, st.session_state.get(f"{key_prefix}select_{symbol}", st.session_state.get(f'{key_prefix}period_{symbol}', "1D")))
+        for symbol, yahoo_symbol in section_commodities
+    )
+
+# Each tile reruns on its own timer, and a range change reruns only that tile
+@st.fragment(run_every=TILE_REFRESH)
+def render_commodity_tile(name, symbol, yahoo_symbol, section_commodities, key_prefix, label, layout, currency, price_format, convert=False):
+    """Range selector, price row and chart for one commodity, in USD or converted to MCX INR units"""
+    # Every tile in a section derives the same batches, so they share one cached download
+    batches = section_batches(section_commodities, key_prefix)
+
+    # Time period selector - Mobile friendly dropdown
+    # Use session state to track selected period per commodity
+    if f'{key_prefix}period_{symbol}' not in st.session_state:
+        st.session_state[f'{key_prefix}period_{symbol}'] = "1D"
+
+    # Dropdown selector instead of buttons
+    selected_period = st.selectbox(
+        "Time Range",
+        options=PERIOD_LABELS,
+        index=PERIOD_INDEX[st.session_state[f'{key_prefix}period_{symbol}']],
+        key=f"{key_prefix}select_{symbol}",
+        label_visibility="collapsed"
+    )
+
+    # Update session state
+    st.session_state[f'{key_prefix}period_{symbol}'] = selected_period
+
+    # 1D gets the last 5 days to ensure we have data even on weekends
+    period, interval = history_params(selected_period)
+
+    # Fetch data
+    try:
+        fetch = fetch_inr if convert else fetch_history
+        fetch_args = (yahoo_symbol, symbol) if convert else (yahoo_symbol,)
+        df_raw = fetch(*fetch_args, period, interval, batches.get((period, interval), ()), refresh_token())
+
+        if df_raw.empty:
+            df = df_raw
+        elif selected_period == "1D":
+            # Rows are time-sorted, so each trading day is a contiguous run
+            times = df_raw.index
+            if times.tz is not None:
+                times = times.tz_localize(None)
+            trading_days = times.to_numpy('datetime64[D]')
+            day_starts = np.flatnonzero(trading_days[1:] != trading_days[:-1]) + 1
+            last_start = day_starts[-1] if len(day_starts) else 0
+
+            # Get last trading day data
+            df = df_raw.iloc[last_start:].copy()
+
+            # Get previous trading day close for comparison
+            if last_start > 0:
+                prev_close = df_raw['Close'].iat[last_start - 1]
+            else:
+                prev_close = df['Close'].iat[0]
+        else:
+            df = df_raw
+            prev_close = df['Close'].iat[0]
+
+        if not df.empty:
+            # Calculate metrics
+            # One array read for the period's high/low and last close (nan-aware like pandas)
+            prices = df[['High', 'Low', 'Close']].to_numpy()
+            d_high = np.nanmax(prices[:, 0])
+            d_low = np.nanmin(prices[:, 1])
+            last_close = prices[-1, 2]
+            change = last_close - prev_close
+            pct_change = (change / prev_close) * 100 if prev_close != 0 else 0
+            is_positive = change >= 0
+
+            # Display price, high and low as one element instead of three metrics
+            delta_class = "price-up" if is_positive else "price-down"
+            st.markdown(
+                f'<div class="price-row">'
+                f'<div><small>{label}</small><br><b>{currency}{last_close:{price_format}}</b><br>'
+                f'<span class="{delta_class}">{change:+{price_format}} ({pct_change:+.2f}%)</span></div>'
+                f'<div><small>High</small><br><b>{currency}{d_high:{price_format}}</b></div>'
+                f'<div><small>Low</small><br><b>{currency}{d_low:{price_format}}</b></div>'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+
+            # Previous close line only for the 1D view
+            fig = reuse_chart(
+                f"{key_prefix}fig_{symbol}",
+                (selected_period, len(df), df.index[-1], last_close, d_low, d_high, prev_close),
+                df, layout, currency, price_format, is_positive, d_low, d_high,
+                prev_close if selected_period == "1D" else None
+            )
+
+            # A stable key lets the frontend update the chart in place
+            st.plotly_chart(fig, use_container_width=True, key=f"{key_prefix}chart_{symbol}")
+        else:
+            st.warning(f"No data available for {name}")
+    except Exception as e:
+        st.error(f"Error loading {name} data: {str(e)}")
 
 # Custom CSS for Montserrat font
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;500;600;700&display=swap');
     
@@ -53,8 +282,33 @@ st.markdown("""
     .stMarkdown {
         font-family: 'Montserrat', sans-serif;
     }
+    
+    .price-row {
+        display: flex;
+        gap: 1rem;
+        font-family: 'Montserrat', sans-serif;
+    }
+    
+    .price-row > div {
+        flex: 1;
+    }
+    
+    .price-row b {
+        font-size: 1.5rem;
+        font-weight: 600;
+    }
+    
+    .price-up {
+        color: #00c853;
+    }
+    
+    .price-down {
+        color: #ff4757;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+# st.html skips the markdown parser
+st.html(CUSTOM_CSS)
 
 # Header with manual refresh button
 col1, col2 = st.columns([4, 1])
@@ -62,6 +316,8 @@ with col1:
     st.title("📊 Commodity Market Charts")
 with col2:
     if st.button("🔄 Refresh", use_container_width=True):
+        # A new salt makes this session miss the refresh-window caches without evicting anyone else's
+        st.session_state.refresh_token = datetime.now().timestamp()
         st.rerun()
 
 st.caption("💡 Live commodity price charts • Auto-refreshes every 30 seconds")
@@ -73,160 +329,15 @@ st.divider()
 st.subheader("🌍 COMEX Futures (International)")
 commodities = [("Gold", "GC=F"), ("Silver", "SI=F"), ("Crude Oil", "CL=F"), ("Copper", "HG=F")]
 
-for i in range(0, len(commodities), 2):
-    cols = st.columns(2)
-    for col, (name, symbol) in zip(cols, commodities[i:i+2]):
-        with col:
-            # Time period selector - Mobile friendly dropdown
-            period_options = {
-                "1D": ("1d", "5m"),
-                "1W": ("5d", "15m"),
-                "1M": ("1mo", "1h"),
-                "3M": ("3mo", "1d"),
-                "6M": ("6mo", "1d"),
-                "1Y": ("1y", "1d"),
-                "3Y": ("3y", "1wk"),
-                "5Y": ("5y", "1wk"),
-                "Max": ("max", "1mo")
-            }
-            
-            # Use session state to track selected period per commodity
-            if f'period_{symbol}' not in st.session_state:
-                st.session_state[f'period_{symbol}'] = "1D"
-            
-            # Dropdown selector instead of buttons
-            selected_period = st.selectbox(
-                "Time Range",
-                options=list(period_options.keys()),
-                index=list(period_options.keys()).index(st.session_state[f'period_{symbol}']),
-                key=f"select_{symbol}",
-                label_visibility="collapsed"
-            )
-            
-            # Update session state
-            st.session_state[f'period_{symbol}'] = selected_period
-            
-            period, interval = period_options[selected_period]
-            
-            # Fetch data
-            try:
-                ticker = yf.Ticker(symbol)
-                
-                # Special handling ONLY for 1D view
-                if selected_period == "1D":
-                    # Get last 5 days to ensure we have data even on weekends
-                    df_raw = ticker.history(period="5d", interval="5m").reset_index()
-                    
-                    if not df_raw.empty:
-                        time_col = 'Datetime' if 'Datetime' in df_raw.columns else 'Date'
-                        
-                        # Get unique trading dates
-                        if time_col == 'Datetime':
-                            df_raw['TradingDate'] = df_raw['Datetime'].dt.date
-                        else:
-                            df_raw['TradingDate'] = df_raw['Date']
-                        
-                        unique_dates = sorted(df_raw['TradingDate'].unique())
-                        
-                        # Get last trading day data
-                        last_trading_day = unique_dates[-1]
-                        df = df_raw[df_raw['TradingDate'] == last_trading_day].copy()
-                        
-                        # Get previous trading day close for comparison
-                        if len(unique_dates) >= 2:
-                            prev_trading_day = unique_dates[-2]
-                            prev_day_data = df_raw[df_raw['TradingDate'] == prev_trading_day]
-                            prev_close = prev_day_data['Close'].iloc[-1]
-                        else:
-                            prev_close = df['Close'].iloc[0]
-                    else:
-                        df = pd.DataFrame()
-                        prev_close = 0
-                else:
-                    # For all other periods, use normal fetching
-                    df = ticker.history(period=period, interval=interval).reset_index()
-                    time_col = 'Datetime' if 'Datetime' in df.columns else 'Date'
-                    prev_close = df['Close'].iloc[0] if not df.empty else 0
-                
-                if not df.empty:
-                    # Calculate metrics
-                    last_close = df['Close'].iloc[-1]
-                    change = last_close - prev_close
-                    pct_change = (change / prev_close) * 100 if prev_close != 0 else 0
-                    is_positive = change >= 0
-                    
-                    # Get high/low for the displayed period
-                    d_high = df['High'].max()
-                    d_low = df['Low'].min()
-                    
-                    # Display metrics with percentage
-                    m1, m2, m3 = st.columns(3)
-                    m1.metric(
-                        name, 
-                        f"${last_close:.2f}", 
-                        f"{change:.2f} ({pct_change:+.2f}%)", 
-                        delta_color="normal"
-                    )
-                    m2.metric("High", f"${d_high:.2f}")
-                    m3.metric("Low", f"${d_low:.2f}")
-                    
-                    # Create area chart with conditional coloring
-                    # Mobile-optimized height
-                    chart_height = 200
-                    fig = px.area(df, x=time_col, y="Close", height=chart_height)
-                    
-                    # Set color based on positive/negative
-                    if is_positive:
-                        line_color = "rgba(0, 200, 83, 1)"  # Green
-                        fill_color = "rgba(0, 200, 83, 0.2)"  # Green with transparency
-                    else:
-                        line_color = "rgba(255, 71, 87, 1)"  # Red
-                        fill_color = "rgba(255, 71, 87, 0.2)"  # Red with transparency
-                    
-                    fig.update_traces(
-                        line_color=line_color,
-                        fillcolor=fill_color,
-                        hovertemplate='<b>Price</b>: $%{y:.2f}<br><b>Time</b>: %{x}<extra></extra>'
-                    )
-                    
-                    fig.update_layout(
-                        margin=dict(l=0, r=0, t=0, b=0),
-                        xaxis_title="",
-                        yaxis_title="Price ($)",
-                        hovermode='x unified',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        font=dict(size=10)  # Smaller font for mobile
-                    )
-                    
-                    # Auto-adjust Y-axis with padding
-                    y_min = df['Low'].min()
-                    y_max = df['High'].max()
-                    y_range = y_max - y_min
-                    y_padding = y_range * 0.1  # 10% padding on each side
-                    
-                    fig.update_yaxes(
-                        range=[y_min - y_padding, y_max + y_padding],
-                        fixedrange=False
-                    )
-                    
-                    # Add previous close line for 1D view
-                    if selected_period == "1D":
-                        fig.add_hline(
-                            y=prev_close, 
-                            line_dash="dot", 
-                            line_color="gray",
-                            opacity=0.5,
-                            annotation_text=f"Prev: ${prev_close:.2f}",
-                            annotation_position="right",
-                            annotation_font_size=9
-                        )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning(f"No data available for {name}")
-            except Exception as e:
-                st.error(f"Error loading {name} data: {str(e)}")
+def render_comex_section():
+    section_commodities = tuple((symbol, symbol) for _, symbol in commodities)
+    for i in range(0, len(commodities), 2):
+        cols = st.columns(2)
+        for col, (name, symbol) in zip(cols, commodities[i:i+2]):
+            with col:
+                render_commodity_tile(name, symbol, symbol, section_commodities, "", name, LAYOUT_USD, "$", ".2f")
+
+render_comex_section()
 
 st.divider()
 
@@ -251,194 +362,18 @@ mcx_to_yahoo = {
     "COPPER": "HG=F"
 }
 
-# Conversion function for MCX
-def convert_to_inr(df, commodity):
-    """Convert international prices to INR"""
-    if commodity == "GOLD":
-        # USD/oz to INR/10g
-        df['Close'] = df['Close'] * (10 / 31.1035) * 83
-        df['High'] = df['High'] * (10 / 31.1035) * 83
-        df['Low'] = df['Low'] * (10 / 31.1035) * 83
-        df['Open'] = df['Open'] * (10 / 31.1035) * 83
-    elif commodity == "SILVER":
-        # USD/oz to INR/kg
-        df['Close'] = df['Close'] * 32.15 * 83
-        df['High'] = df['High'] * 32.15 * 83
-        df['Low'] = df['Low'] * 32.15 * 83
-        df['Open'] = df['Open'] * 32.15 * 83
-    elif commodity == "CRUDEOIL":
-        # USD/barrel to INR/barrel
-        df['Close'] = df['Close'] * 83
-        df['High'] = df['High'] * 83
-        df['Low'] = df['Low'] * 83
-        df['Open'] = df['Open'] * 83
-    elif commodity == "COPPER":
-        # USD/lb to INR/kg
-        df['Close'] = df['Close'] * 2.205 * 83
-        df['High'] = df['High'] * 2.205 * 83
-        df['Low'] = df['Low'] * 2.205 * 83
-        df['Open'] = df['Open'] * 2.205 * 83
-    return df
-
-for i in range(0, len(mcx_commodities), 2):
-    cols = st.columns(2)
-    for col, (name, symbol) in zip(cols, mcx_commodities[i:i+2]):
-        with col:
-            # Time period selector
-            period_options = {
-                "1D": ("1d", "5m"),
-                "1W": ("5d", "15m"),
-                "1M": ("1mo", "1h"),
-                "3M": ("3mo", "1d"),
-                "6M": ("6mo", "1d"),
-                "1Y": ("1y", "1d"),
-                "3Y": ("3y", "1wk"),
-                "5Y": ("5y", "1wk"),
-                "Max": ("max", "1mo")
-            }
-            
-            # Use session state
-            if f'mcx_period_{symbol}' not in st.session_state:
-                st.session_state[f'mcx_period_{symbol}'] = "1D"
-            
-            selected_period = st.selectbox(
-                "Time Range",
-                options=list(period_options.keys()),
-                index=list(period_options.keys()).index(st.session_state[f'mcx_period_{symbol}']),
-                key=f"mcx_select_{symbol}",
-                label_visibility="collapsed"
-            )
-            
-            # Update session state
-            st.session_state[f'mcx_period_{symbol}'] = selected_period
-            
-            period, interval = period_options[selected_period]
-            
-            # Fetch data
-            try:
-                yahoo_symbol = mcx_to_yahoo[symbol]
-                ticker = yf.Ticker(yahoo_symbol)
-                
-                # Special handling ONLY for 1D view
-                if selected_period == "1D":
-                    # Get last 5 days to ensure we have data even on weekends
-                    df_raw = ticker.history(period="5d", interval="5m").reset_index()
-                    
-                    if not df_raw.empty:
-                        # Convert to INR
-                        df_raw = convert_to_inr(df_raw, symbol)
-                        
-                        time_col = 'Datetime' if 'Datetime' in df_raw.columns else 'Date'
-                        
-                        # Get unique trading dates
-                        if time_col == 'Datetime':
-                            df_raw['TradingDate'] = df_raw['Datetime'].dt.date
-                        else:
-                            df_raw['TradingDate'] = df_raw['Date']
-                        
-                        unique_dates = sorted(df_raw['TradingDate'].unique())
-                        
-                        # Get last trading day data
-                        last_trading_day = unique_dates[-1]
-                        df = df_raw[df_raw['TradingDate'] == last_trading_day].copy()
-                        
-                        # Get previous trading day close for comparison
-                        if len(unique_dates) >= 2:
-                            prev_trading_day = unique_dates[-2]
-                            prev_day_data = df_raw[df_raw['TradingDate'] == prev_trading_day]
-                            prev_close = prev_day_data['Close'].iloc[-1]
-                        else:
-                            prev_close = df['Close'].iloc[0]
-                    else:
-                        df = pd.DataFrame()
-                        prev_close = 0
-                else:
-                    # For all other periods, use normal fetching
-                    df = ticker.history(period=period, interval=interval).reset_index()
-                    if not df.empty:
-                        df = convert_to_inr(df, symbol)
-                    time_col = 'Datetime' if 'Datetime' in df.columns else 'Date'
-                    prev_close = df['Close'].iloc[0] if not df.empty else 0
-                
-                if not df.empty:
-                    # Calculate metrics
-                    last_close = df['Close'].iloc[-1]
-                    change = last_close - prev_close
-                    pct_change = (change / prev_close) * 100 if prev_close != 0 else 0
-                    is_positive = change >= 0
-                    
-                    # Get high/low for the displayed period
-                    d_high = df['High'].max()
-                    d_low = df['Low'].min()
-                    
-                    # Display metrics with percentage
-                    m1, m2, m3 = st.columns(3)
-                    m1.metric(
-                        f"MCX {name}", 
-                        f"₹{last_close:,.0f}", 
-                        f"{change:,.0f} ({pct_change:+.2f}%)", 
-                        delta_color="normal"
-                    )
-                    m2.metric("High", f"₹{d_high:,.0f}")
-                    m3.metric("Low", f"₹{d_low:,.0f}")
-                    
-                    # Create area chart with conditional coloring
-                    # Mobile-optimized height
-                    chart_height = 200
-                    fig = px.area(df, x=time_col, y="Close", height=chart_height)
-                    
-                    # Set color based on positive/negative
-                    if is_positive:
-                        line_color = "rgba(0, 200, 83, 1)"  # Green
-                        fill_color = "rgba(0, 200, 83, 0.2)"  # Green with transparency
-                    else:
-                        line_color = "rgba(255, 71, 87, 1)"  # Red
-                        fill_color = "rgba(255, 71, 87, 0.2)"  # Red with transparency
-                    
-                    fig.update_traces(
-                        line_color=line_color,
-                        fillcolor=fill_color,
-                        hovertemplate='<b>Price</b>: ₹%{y:,.0f}<br><b>Time</b>: %{x}<extra></extra>'
-                    )
-                    
-                    fig.update_layout(
-                        margin=dict(l=0, r=0, t=0, b=0),
-                        xaxis_title="",
-                        yaxis_title="Price (₹)",
-                        hovermode='x unified',
-                        plot_bgcolor='rgba(0,0,0,0)',
-                        paper_bgcolor='rgba(0,0,0,0)',
-                        font=dict(size=10)  # Smaller font for mobile
-                    )
-                    
-                    # Auto-adjust Y-axis with padding
-                    y_min = df['Low'].min()
-                    y_max = df['High'].max()
-                    y_range = y_max - y_min
-                    y_padding = y_range * 0.1  # 10% padding on each side
-                    
-                    fig.update_yaxes(
-                        range=[y_min - y_padding, y_max + y_padding],
-                        fixedrange=False
-                    )
-                    
-                    # Add previous close line for 1D view
-                    if selected_period == "1D":
-                        fig.add_hline(
-                            y=prev_close, 
-                            line_dash="dot", 
-                            line_color="gray",
-                            opacity=0.5,
-                            annotation_text=f"Prev: ₹{prev_close:,.0f}",
-                            annotation_position="right",
-                            annotation_font_size=9
-                        )
-                    
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning(f"No data available for {name}")
-            except Exception as e:
-                st.error(f"Error loading {name} data: {str(e)}")
+def render_mcx_section():
+    section_commodities = tuple((symbol, mcx_to_yahoo[symbol]) for _, symbol in mcx_commodities)
+    for i in range(0, len(mcx_commodities), 2):
+        cols = st.columns(2)
+        for col, (name, symbol) in zip(cols, mcx_commodities[i:i+2]):
+            with col:
+                render_commodity_tile(
+                    name, symbol, mcx_to_yahoo[symbol], section_commodities, "mcx_", f"MCX {name}",
+                    LAYOUT_INR, "₹", ",.0f", convert=True
+                )
+
+render_mcx_section()
 
 st.divider()
 
@@ -448,43 +383,46 @@ st.divider()
 st.subheader("📰 Market News & Headlines")
 st.caption("Latest updates from Economic Times, Moneycontrol, and more")
 
-try:
-    news_items = get_live_market_news()
+@st.fragment(run_every=300)
+def render_news_section():
+    try:
+        news_items = fetch_news(refresh_token())
     
-    # Separate recommendation news and general news
-    reco_news = [item for item in news_items if item.get('category') == 'recommendation']
-    market_news = [item for item in news_items if item.get('category') != 'recommendation']
+        # Separate recommendation news and general news in one pass
+        reco_news, market_news = [], []
+        for item in news_items:
+            (reco_news if item.get('category') == 'recommendation' else market_news).append(item)
     
-    # Create two columns
-    col1, col2 = st.columns(2)
+        # Create two columns
+        col1, col2 = st.columns(2)
     
-    with col1:
-        st.markdown("#### 💼 Stock Recommendations")
-        for item in reco_news[:6]:
-            with st.expander(f"📌 {item['title'][:80]}..."):
-                st.markdown(f"**Source:** {item['publisher']}")
-                pub_time = datetime.fromtimestamp(item['provider_publish_time'])
-                st.caption(f"Published: {pub_time.strftime('%d %b, %H:%M')}")
-                if item.get('link') and item['link'] != '#':
-                    st.markdown(f"[Read Full Article]({item['link']})")
+        with col1:
+            st.markdown("#### 💼 Stock Recommendations")
+            for item in reco_news[:6]:
+                with st.expander(f"📌 {item['title'][:80]}..."):
+                    st.markdown(f"**Source:** {item['publisher']}")
+                    st.caption(f"Published: {item['published_str']}")
+                    if item.get('link') and item['link'] != '#':
+                        st.markdown(f"[Read Full Article]({item['link']})")
     
-    with col2:
-        st.markdown("#### 📊 General Headlines")
-        for item in market_news[:6]:
-            with st.expander(f"📰 {item['title'][:80]}..."):
-                st.markdown(f"**Source:** {item['publisher']}")
-                pub_time = datetime.fromtimestamp(item['provider_publish_time'])
-                st.caption(f"Published: {pub_time.strftime('%d %b, %H:%M')}")
-                if item.get('link') and item['link'] != '#':
-                    st.markdown(f"[Read Full Article]({item['link']})")
-except Exception as e:
-    st.warning("Unable to load news at this time. Please try again later.")
+        with col2:
+            st.markdown("#### 📊 General Headlines")
+            for item in market_news[:6]:
+                with st.expander(f"📰 {item['title'][:80]}..."):
+                    st.markdown(f"**Source:** {item['publisher']}")
+                    st.caption(f"Published: {item['published_str']}")
+                    if item.get('link') and item['link'] != '#':
+                        st.markdown(f"[Read Full Article]({item['link']})")
+    except Exception as e:
+        st.warning("Unable to load news at this time. Please try again later.")
+
+render_news_section()
 
 st.divider()
 
 # Footer
 col1, col2 = st.columns(2)
 with col1:
-    st.caption(f"📊 Last refresh: {datetime.now().strftime('%d %b %Y, %H:%M:%S')} • Refresh #{count}")
+    st.caption(f"📊 Last refresh: {datetime.now().strftime('%d %b %Y, %H:%M:%S')}")
 with col2:
     st.caption("📈 Data from Yahoo Finance, MCX India, Economic Times & Moneycontrol")
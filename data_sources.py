@@ -1,20 +1,72 @@
 import yfinance as yf
 import pandas as pd
+import numpy as np
 import requests
 import io
+import os
+import json
 import time
+import threading
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+import html
 from bs4 import BeautifulSoup
-import feedparser
+from lxml import etree
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 # Global cache for NSE stocks (refreshes daily)
 _nse_stock_cache = None
 _cache_time = None
 
+# Ticker objects reused for a short window (they memoize info and news, so not indefinitely)
+_ticker_cache = {}
+_ticker_lock = threading.Lock()  # lookups run from thread pools
+TICKER_TTL = 120
+TICKER_CACHE_MAX = 128
+
+def get_ticker(symbol):
+    """yf.Ticker for symbol, shared by every lookup within TICKER_TTL seconds"""
+    now = time.time()
+    with _ticker_lock:
+        cached = _ticker_cache.get(symbol)
+        if cached and now - cached[1] < TICKER_TTL:
+            return cached[0]
+        # Drop every expired entry on insert so searched symbols don't accumulate forever
+        for key in [k for k, (_, created) in _ticker_cache.items() if now - created >= TICKER_TTL]:
+            del _ticker_cache[key]
+        # Bound the live entries too; the dict is in insertion order, so the first key is the oldest
+        while len(_ticker_cache) >= TICKER_CACHE_MAX:
+            del _ticker_cache[next(iter(_ticker_cache))]
+        ticker = yf.Ticker(symbol)
+        _ticker_cache[symbol] = (ticker, now)
+    return ticker
+
+def quote_price(ticker, info):
+    """Last price from an already-fetched info dict, falling back to fast_info (another request)"""
+    return info.get('currentPrice') or info.get('regularMarketPrice') or ticker.fast_info.get('lastPrice', 0)
+
+# USD quote -> MCX INR unit conversion factors (USD/INR taken as 83)
+INR_FACTORS = {
+    "GOLD": (10 / 31.1035) * 83,  # USD/oz to INR/10g (1 oz = 31.1g)
+    "SILVER": 32.15 * 83,         # USD/oz to INR/kg (1 kg = 32.15 oz)
+    "CRUDEOIL": 83,               # USD/barrel to INR/barrel
+    "COPPER": 2.205 * 83,         # USD/lb to INR/kg (1 kg = 2.205 lb)
+}
+OHLC_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+def convert_to_inr(df, commodity):
+    """Convert international prices to MCX INR units in place; other commodities are left as is"""
+    factor = INR_FACTORS.get(commodity, 1)
+    if factor == 1 or df.empty:
+        return df
+    # One multiply over the OHLC block instead of a column assignment per price
+    df[OHLC_COLUMNS] = df[OHLC_COLUMNS].to_numpy() * factor
+    return df
+
 def fetch_comex(symbol):
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = get_ticker(symbol)
         return ticker.history(period="5d", interval="1m").reset_index()
     except Exception as e:
         print(f"Error fetching COMEX data: {e}")
@@ -35,42 +87,13 @@ def fetch_mcx_intraday(commodity):
     
     try:
         symbol = mcx_symbols.get(commodity, "GC=F")
-        ticker = yf.Ticker(symbol)
+        ticker = get_ticker(symbol)
         
         # Get 5 days of 5-minute interval data for intraday charts
         df = ticker.history(period="5d", interval="5m")
         
         if not df.empty:
-            df = df.reset_index()
-            # Convert to INR (approximate conversion - Gold is in USD/oz, MCX is in INR/10g)
-            if commodity == "GOLD":
-                # Rough conversion: USD/oz to INR/10g
-                # 1 oz = 31.1g, so 10g = 10/31.1 oz
-                # Multiply by USD to INR rate (approx 83)
-                df['Close'] = df['Close'] * (10 / 31.1035) * 83
-                df['High'] = df['High'] * (10 / 31.1035) * 83
-                df['Low'] = df['Low'] * (10 / 31.1035) * 83
-                df['Open'] = df['Open'] * (10 / 31.1035) * 83
-            elif commodity == "SILVER":
-                # Silver: USD/oz to INR/kg (1 kg = 32.15 oz)
-                df['Close'] = df['Close'] * 32.15 * 83
-                df['High'] = df['High'] * 32.15 * 83
-                df['Low'] = df['Low'] * 32.15 * 83
-                df['Open'] = df['Open'] * 32.15 * 83
-            elif commodity == "CRUDEOIL":
-                # Crude: USD/barrel to INR/barrel
-                df['Close'] = df['Close'] * 83
-                df['High'] = df['High'] * 83
-                df['Low'] = df['Low'] * 83
-                df['Open'] = df['Open'] * 83
-            elif commodity == "COPPER":
-                # Copper: USD/lb to INR/kg (1 kg = 2.205 lb)
-                df['Close'] = df['Close'] * 2.205 * 83
-                df['High'] = df['High'] * 2.205 * 83
-                df['Low'] = df['Low'] * 2.205 * 83
-                df['Open'] = df['Open'] * 2.205 * 83
-            
-            return df
+            return convert_to_inr(df.reset_index(), commodity)
         
     except Exception as e:
         print(f"Error fetching MCX intraday for {commodity}: {e}")
@@ -81,8 +104,9 @@ def fetch_mcx_two_days():
     """Fallback function to get MCX data from Bhavcopy files"""
     found = []
     headers = {'User-Agent': 'Mozilla/5.0'}
+    today = datetime.now()
     for i in range(10):
-        date = (datetime.now() - timedelta(days=i)).strftime("%Y%m%d")
+        date = (today - timedelta(days=i)).strftime("%Y%m%d")
         url = f"https://www.mcxindia.com/downloads/Bhavcopy_{date}.csv"
         try:
             r = requests.get(url, headers=headers, timeout=5)
@@ -91,12 +115,15 @@ def fetch_mcx_two_days():
                 df.columns = df.columns.str.strip().str.upper()
                 found.append(df)
             if len(found) == 2: break
-        except: continue
+        except (requests.RequestException, ValueError):
+            # Network failure or a malformed/empty bhavcopy (pandas parse errors are ValueErrors)
+            continue
     return (found[0], found[1]) if len(found) >= 2 else (pd.DataFrame(), pd.DataFrame())
 
 def get_intraday_recommendations():
     """Get intraday trading recommendations with robust error handling"""
     intraday_picks = []
+    stamp = datetime.now().strftime('%Y-%m-%d %H:%M')
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     }
@@ -111,10 +138,16 @@ def get_intraday_recommendations():
         
         momentum_stocks = []
         
+        # One multi-ticker request instead of a history call per symbol
+        combined = yf.download(
+            nifty50_symbols, period="2d", interval="5m",
+            group_by='ticker', auto_adjust=True, threads=True, progress=False
+        )
+        
         for symbol in nifty50_symbols:
             try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period="2d", interval="5m")
+                # Symbols share the batch's time index, so drop rows this one has no data for
+                hist = combined[symbol].dropna(how='all')
                 
                 if not hist.empty and len(hist) > 20:
                     cmp = hist['Close'].iloc[-1]
@@ -164,7 +197,7 @@ def get_intraday_recommendations():
                     "Upside %": round(upside, 2),
                     "Type": pick_type,
                     "Timeframe": "Intraday",
-                    "Date": datetime.now().strftime('%Y-%m-%d %H:%M')
+                    "Date": stamp
                 })
             except:
                 continue
@@ -185,7 +218,7 @@ def get_intraday_recommendations():
                 for stock in results:
                     try:
                         symbol = f"{stock.get('short_name', '')}.NS"
-                        ticker = yf.Ticker(symbol)
+                        ticker = get_ticker(symbol)
                         cmp = ticker.fast_info.get('lastPrice', 0)
                         
                         if cmp > 0:
@@ -201,7 +234,7 @@ def get_intraday_recommendations():
                                 "Upside %": 2.5,
                                 "Type": "Top Gainer",
                                 "Timeframe": "Intraday",
-                                "Date": datetime.now().strftime('%Y-%m-%d %H:%M')
+                                "Date": stamp
                             })
                     except:
                         continue
@@ -220,7 +253,7 @@ def get_intraday_recommendations():
             
             for symbol, name in fallback_stocks[:3]:
                 try:
-                    ticker = yf.Ticker(symbol)
+                    ticker = get_ticker(symbol)
                     hist = ticker.history(period="5d", interval="5m")
                     
                     if not hist.empty:
@@ -240,7 +273,7 @@ def get_intraday_recommendations():
                                 "Upside %": 1.5,
                                 "Type": "Technical",
                                 "Timeframe": "Intraday",
-                                "Date": datetime.now().strftime('%Y-%m-%d %H:%M')
+                                "Date": stamp
                             })
                 except:
                     continue
@@ -261,12 +294,14 @@ def get_intraday_recommendations():
         "Upside %": 0,
         "Type": "Refreshing",
         "Timeframe": "Intraday",
-        "Date": datetime.now().strftime('%Y-%m-%d %H:%M')
+        "Date": stamp
     }])
 
 def get_longterm_recommendations():
     """Get long-term (swing/positional) recommendations with robust error handling"""
     longterm_picks = []
+    now = datetime.now()
+    today = now.strftime('%Y-%m-%d')
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     }
@@ -279,11 +314,11 @@ def get_longterm_recommendations():
             "KOTAKBANK.NS", "LT.NS", "MARUTI.NS", "TITAN.NS", "SUNPHARMA.NS"
         ]
         
-        for symbol in top_stocks:
+        def analyst_pick(symbol):
             try:
-                ticker = yf.Ticker(symbol)
+                ticker = get_ticker(symbol)
                 info = ticker.info
-                cmp = ticker.fast_info.get('lastPrice', 0)
+                cmp = quote_price(ticker, info)
                 
                 # Get analyst target price and recommendation
                 target = info.get('targetMeanPrice', 0)
@@ -296,7 +331,7 @@ def get_longterm_recommendations():
                     if upside > 5:
                         stop_loss = cmp * 0.90
                         
-                        longterm_picks.append({
+                        return {
                             "Stock": info.get('shortName', symbol.replace('.NS', '')),
                             "Symbol": symbol,
                             "CMP": round(cmp, 2),
@@ -305,11 +340,16 @@ def get_longterm_recommendations():
                             "Upside %": round(upside, 2),
                             "Type": "Analyst",
                             "Timeframe": "1-3 months",
-                            "Date": datetime.now().strftime('%Y-%m-%d'),
+                            "Date": today,
                             "Source": "Yahoo Finance"
-                        })
+                        }
             except:
-                continue
+                pass
+            return None
+        
+        # Each symbol needs its own quote and info requests, so run them concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            longterm_picks.extend(pick for pick in executor.map(analyst_pick, top_stocks) if pick)
     except Exception as e:
         print(f"Yahoo Finance analyst reco error: {e}")
     
@@ -317,12 +357,12 @@ def get_longterm_recommendations():
     if len(longterm_picks) < 5:
         try:
             et_reco_rss = "https://economictimes.indiatimes.com/markets/stocks/recos/rssfeeds/1977021501.cms"
-            feed = feedparser.parse(et_reco_rss)
+            entries = fetch_rss_entries(et_reco_rss, limit=10)
             
-            if feed and hasattr(feed, 'entries'):
-                for entry in feed.entries[:10]:
+            if entries:
+                for entry in entries:
                     try:
-                        title = entry.title
+                        title = entry['title']
                         
                         # Parse: "Stock Name: Buy/Sell, Target Rs XX"
                         stock_match = re.search(r'^([^:]+?)(?:\s*-|\s*:)', title)
@@ -340,7 +380,7 @@ def get_longterm_recommendations():
                             symbol = get_nse_symbol(stock_name)
                             if symbol:
                                 try:
-                                    ticker = yf.Ticker(symbol)
+                                    ticker = get_ticker(symbol)
                                     cmp = ticker.fast_info.get('lastPrice', 0)
                                     
                                     if cmp > 0:
@@ -351,7 +391,8 @@ def get_longterm_recommendations():
                                         
                                         if upside > 3:  # Only show if upside > 3%
                                             stop_loss = cmp * 0.92
-                                            pub_date = entry.get('published', datetime.now().strftime('%Y-%m-%d'))[:10]
+                                            published = datetime.fromtimestamp(entry['published']) if entry['published'] else now
+                                            pub_date = published.strftime('%Y-%m-%d')
                                             
                                             longterm_picks.append({
                                                 "Stock": stock_name,
@@ -384,7 +425,7 @@ def get_longterm_recommendations():
             
             for symbol, name in blue_chips:
                 try:
-                    ticker = yf.Ticker(symbol)
+                    ticker = get_ticker(symbol)
                     hist = ticker.history(period="3mo", interval="1d")
                     
                     if not hist.empty:
@@ -406,7 +447,7 @@ def get_longterm_recommendations():
                                 "Upside %": upside,
                                 "Type": "Technical",
                                 "Timeframe": "4-6 weeks",
-                                "Date": datetime.now().strftime('%Y-%m-%d'),
+                                "Date": today,
                                 "Source": "Technical Analysis"
                             })
                 except:
@@ -432,10 +473,18 @@ def get_longterm_recommendations():
         "Upside %": 0,
         "Type": "Refreshing",
         "Timeframe": "Loading",
-        "Date": datetime.now().strftime('%Y-%m-%d'),
+        "Date": today,
         "Source": "System"
     }])
 
+# Yahoo recommendationKey -> displayed sentiment; anything else is HOLD
+RECOMMENDATION_SENTIMENT = {
+    'strong_buy': "BUY",
+    'buy': "BUY",
+    'strong_sell': "SELL",
+    'sell': "SELL",
+}
+
 def search_stock_recommendations(ticker_symbol):
     """
     Search for stock recommendations by ticker symbol
@@ -455,12 +504,15 @@ def search_stock_recommendations(ticker_symbol):
         ticker_symbol = f"{ticker_symbol}.NS"
     
     try:
-        ticker = yf.Ticker(ticker_symbol)
-        info = ticker.info
+        ticker = get_ticker(ticker_symbol)
+        # The info scrape and the intraday history are independent requests, so overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            hist_future = executor.submit(ticker.history, period="5d", interval="5m")
+            info = ticker.info
         
         # Get basic info
         result['name'] = info.get('shortName', ticker_symbol.replace('.NS', ''))
-        result['cmp'] = ticker.fast_info.get('lastPrice', 0)
+        result['cmp'] = quote_price(ticker, info)
         
         if result['cmp'] == 0:
             result['error'] = "Stock not found or invalid ticker"
@@ -468,21 +520,17 @@ def search_stock_recommendations(ticker_symbol):
         
         # === INTRADAY RECOMMENDATIONS ===
         try:
-            hist = ticker.history(period="5d", interval="5m")
+            hist = hist_future.result()
             
             if not hist.empty and len(hist) > 20:
-                open_price = hist['Open'].iloc[0]
-                current_price = hist['Close'].iloc[-1]
+                open_price = hist['Open'].iat[0]
+                current_price = hist['Close'].iat[-1]
                 high_today = hist['High'].max()
                 low_today = hist['Low'].min()
                 
                 # Calculate intraday momentum
                 change_pct = ((current_price - open_price) / open_price) * 100
                 
-                # Calculate support and resistance
-                recent_20 = hist.tail(20)
-                avg_price = recent_20['Close'].mean()
-                
                 # Determine intraday targets
                 if change_pct > 0.3:  # Bullish momentum
                     target = current_price * 1.02
@@ -535,12 +583,7 @@ def search_stock_recommendations(ticker_symbol):
                 min_upside = ((target_low - result['cmp']) / result['cmp']) * 100 if target_low else 0
                 
                 # Determine recommendation sentiment
-                if recommendation_key in ['strong_buy', 'buy']:
-                    sentiment = "BUY"
-                elif recommendation_key in ['strong_sell', 'sell']:
-                    sentiment = "SELL"
-                else:
-                    sentiment = "HOLD"
+                sentiment = RECOMMENDATION_SENTIMENT.get(recommendation_key, "HOLD")
                 
                 result['longterm'] = {
                     'available': True,
@@ -591,12 +634,14 @@ def get_stock_recommendation_multi_source(ticker_symbol):
         if not result.get('longterm') or not result['longterm'].get('available'):
             try:
                 ns_sym = ticker_symbol if ticker_symbol.endswith('.NS') else f"{ticker_symbol}.NS"
-                tkr = yf.Ticker(ns_sym)
+                tkr = get_ticker(ns_sym)
                 hist = tkr.history(period="3mo", interval="1d")
                 if not hist.empty and len(hist) >= 10:
-                    cmp = hist['Close'].iloc[-1]
-                    avg20 = hist['Close'].tail(20).mean() if len(hist) >= 20 else hist['Close'].mean()
-                    avg50 = hist['Close'].tail(50).mean() if len(hist) >= 50 else avg20
+                    # One array read; a short history's 20-bar slice is simply all of it
+                    closes = hist['Close'].to_numpy()
+                    cmp = closes[-1]
+                    avg20 = np.nanmean(closes[-20:])
+                    avg50 = np.nanmean(closes[-50:]) if len(closes) >= 50 else avg20
                     if cmp > avg20 and cmp > avg50:
                         trend, mult = "BUY", 1.12
                     elif cmp > avg20:
@@ -627,9 +672,9 @@ def get_stock_recommendation_multi_source(ticker_symbol):
     try:
         clean = ticker_symbol.replace('.NS', '').replace('.BO', '')
         bo_sym = f"{clean}.BO"
-        tkr2 = yf.Ticker(bo_sym)
+        tkr2 = get_ticker(bo_sym)
         info2 = tkr2.info
-        cmp2 = tkr2.fast_info.get('lastPrice', 0)
+        cmp2 = quote_price(tkr2, info2)
 
         if cmp2 and cmp2 > 0:
             result2 = {
@@ -675,7 +720,7 @@ def get_stock_recommendation_multi_source(ticker_symbol):
                 rk = info2.get('recommendationKey', 'hold')
                 na = info2.get('numberOfAnalystOpinions', 0)
                 if tm and tm > 0:
-                    sent = "BUY" if rk in ['strong_buy', 'buy'] else "SELL" if rk in ['strong_sell', 'sell'] else "HOLD"
+                    sent = RECOMMENDATION_SENTIMENT.get(rk, "HOLD")
                     result2['longterm'] = {
                         'available': True, 'recommendation': sent,
                         'cmp': round(cmp2, 2), 'avg_target': round(tm, 2),
@@ -1353,115 +1398,178 @@ def get_nse_symbol(stock_name):
     cleaned = stock_name.upper().replace(' LTD', '').replace(' LIMITED', '').replace('.', '').replace('&', '').replace(' ', '')
     return f"{cleaned}.NS"
 
+# RSS 2.0 <item>, RSS 1.0/RDF <item> and Atom <entry>
+FEED_ITEM_TAGS = ('item', '{http://purl.org/rss/1.0/}item', '{http://www.w3.org/2005/Atom}entry')
+
+def feed_timestamp(text):
+    """Epoch seconds from an RFC 822 (RSS) or ISO 8601 (Atom, dc:date) date, or None"""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        return parsedate_to_datetime(text).timestamp()
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(text.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+def fetch_rss_entries(url, limit=10, timeout=10):
+    """
+    First `limit` items of an RSS/RDF/Atom feed as dicts with title, link, summary and published (epoch or None).
+    Reads only the fields the news cards use, stopping once enough items are parsed.
+    """
+    response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=timeout)
+    response.raise_for_status()
+
+    entries = []
+    for _, item in etree.iterparse(io.BytesIO(response.content), tag=FEED_ITEM_TAGS, recover=True):
+        # Children by local name, so namespaced RDF/Atom fields read the same as plain RSS
+        fields = {}
+        for child in item:
+            if isinstance(child.tag, str):
+                # First one wins: Atom's main link comes before rel="self"/"enclosure" ones
+                fields.setdefault(etree.QName(child).localname, child)
+        def text(*names):
+            for name in names:
+                if name in fields and fields[name].text:
+                    return fields[name].text.strip()
+            return ''
+        # feedparser used to unescape entities left inside CDATA (e.g. a literal &amp;)
+        title = html.unescape(text('title'))
+        if title:
+            link = text('link') or (fields['link'].get('href', '') if 'link' in fields else '')
+            entries.append({
+                'title': title,
+                'link': html.unescape(link.strip()) or '#',
+                'summary': text('description', 'summary', 'content'),
+                'published': feed_timestamp(text('pubDate', 'published', 'updated', 'date')),
+            })
+        item.clear()
+        if len(entries) >= limit:
+            break
+    if not entries:
+        print(f"No RSS/Atom items parsed from {url}")
+    return entries
+
+NEWS_FEEDS = {
+    'mc_latest': "https://www.moneycontrol.com/rss/latestnews.xml",
+    'et_reco': "https://economictimes.indiatimes.com/markets/stocks/recos/rssfeeds/1977021501.cms",
+    'et_market': "https://economictimes.indiatimes.com/markets/rssfeeds/1977021501.cms",
+    'bs_markets': "https://www.business-standard.com/rss/markets-106.rss",
+}
+
+def yahoo_index_news(now_ts):
+    """Latest Yahoo Finance headlines for the NIFTY and SENSEX tickers"""
+    items = []
+    for sym in ["^NSEI", "^BSESN"]:
+        try:
+            ticker = get_ticker(sym)
+            # Filter malformed items once here so later passes can index them directly
+            # (the dedupe below slices every title, so it must be a non-empty str)
+            news = [
+                item for item in (ticker.news or [])[:5]
+                if isinstance(item, dict) and isinstance(item.get('title'), str) and item['title']
+            ]
+            for item in news:
+                item.setdefault('publisher', 'Yahoo Finance')
+                item.setdefault('link', item.get('link', '#'))
+                if 'providerPublishTime' in item:
+                    item['provider_publish_time'] = item['providerPublishTime']
+                else:
+                    item['provider_publish_time'] = now_ts
+                item['category'] = 'market'
+                items.append(item)
+        except Exception:
+            # Network or parsing failure for one index; try the next
+            continue
+    return items
+
 def get_live_market_news():
     """Get market news from multiple RSS sources with robust error handling"""
     all_news = []
+    now = datetime.now()
+    now_ts = now.timestamp()
+    
+    # Every source is an independent download, so fetch them all concurrently
+    with ThreadPoolExecutor(max_workers=len(NEWS_FEEDS) + 1) as pool:
+        yahoo = pool.submit(yahoo_index_news, now_ts)
+        feeds = {name: pool.submit(fetch_rss_entries, url) for name, url in NEWS_FEEDS.items()}
     
     # Source 1: Yahoo Finance India (Most reliable)
     try:
-        for sym in ["^NSEI", "^BSESN"]:
-            try:
-                ticker = yf.Ticker(sym)
-                news = ticker.news
-                if news:
-                    for item in news[:5]:
-                        if isinstance(item, dict) and 'title' in item:
-                            item.setdefault('publisher', 'Yahoo Finance')
-                            item.setdefault('link', item.get('link', '#'))
-                            if 'providerPublishTime' in item:
-                                item['provider_publish_time'] = item['providerPublishTime']
-                            else:
-                                item['provider_publish_time'] = datetime.now().timestamp()
-                            item['category'] = 'market'
-                            all_news.append(item)
-            except:
-                continue
+        all_news.extend(yahoo.result())
     except Exception as e:
         print(f"Yahoo Finance error: {e}")
     
     # Source 2: Moneycontrol Latest News
     try:
-        mc_latest = "https://www.moneycontrol.com/rss/latestnews.xml"
-        feed = feedparser.parse(mc_latest)
+        entries = feeds['mc_latest'].result()
         
-        if feed and hasattr(feed, 'entries'):
-            for entry in feed.entries[:10]:
-                try:
-                    title_lower = entry.title.lower()
-                    if any(word in title_lower for word in ['stock', 'market', 'nifty', 'sensex', 'share', 'trading', 'invest', 'equity']):
-                        news_item = {
-                            'title': entry.title,
-                            'publisher': 'Moneycontrol',
-                            'link': entry.link if hasattr(entry, 'link') else '#',
-                            'provider_publish_time': datetime(*entry.published_parsed[:6]).timestamp() if hasattr(entry, 'published_parsed') else datetime.now().timestamp(),
-                            'category': 'market'
-                        }
-                        all_news.append(news_item)
-                except:
-                    continue
+        if entries:
+            for entry in entries[:10]:
+                title_lower = entry['title'].lower()
+                if any(word in title_lower for word in ['stock', 'market', 'nifty', 'sensex', 'share', 'trading', 'invest', 'equity']):
+                    news_item = {
+                        'title': entry['title'],
+                        'publisher': 'Moneycontrol',
+                        'link': entry['link'],
+                        'provider_publish_time': entry['published'] or now_ts,
+                        'category': 'market'
+                    }
+                    all_news.append(news_item)
     except Exception as e:
         print(f"Moneycontrol Latest RSS error: {e}")
     
     # Source 3: Economic Times Stock Recommendations
     try:
-        et_reco_rss = "https://economictimes.indiatimes.com/markets/stocks/recos/rssfeeds/1977021501.cms"
-        feed = feedparser.parse(et_reco_rss)
-        
-        if feed and hasattr(feed, 'entries'):
-            for entry in feed.entries[:8]:
-                try:
-                    news_item = {
-                        'title': entry.title,
-                        'publisher': 'ET - Stock Picks',
-                        'link': entry.link if hasattr(entry, 'link') else '#',
-                        'provider_publish_time': datetime(*entry.published_parsed[:6]).timestamp() if hasattr(entry, 'published_parsed') else datetime.now().timestamp(),
-                        'category': 'recommendation'
-                    }
-                    all_news.append(news_item)
-                except:
-                    continue
+        entries = feeds['et_reco'].result()
+        
+        if entries:
+            for entry in entries[:8]:
+                news_item = {
+                    'title': entry['title'],
+                    'publisher': 'ET - Stock Picks',
+                    'link': entry['link'],
+                    'provider_publish_time': entry['published'] or now_ts,
+                    'category': 'recommendation'
+                }
+                all_news.append(news_item)
     except Exception as e:
         print(f"ET Reco RSS error: {e}")
     
     # Source 4: Economic Times Market News
     try:
-        et_market_rss = "https://economictimes.indiatimes.com/markets/rssfeeds/1977021501.cms"
-        feed = feedparser.parse(et_market_rss)
-        
-        if feed and hasattr(feed, 'entries'):
-            for entry in feed.entries[:8]:
-                try:
-                    news_item = {
-                        'title': entry.title,
-                        'publisher': 'Economic Times',
-                        'link': entry.link if hasattr(entry, 'link') else '#',
-                        'provider_publish_time': datetime(*entry.published_parsed[:6]).timestamp() if hasattr(entry, 'published_parsed') else datetime.now().timestamp(),
-                        'category': 'market'
-                    }
-                    all_news.append(news_item)
-                except:
-                    continue
+        entries = feeds['et_market'].result()
+        
+        if entries:
+            for entry in entries[:8]:
+                news_item = {
+                    'title': entry['title'],
+                    'publisher': 'Economic Times',
+                    'link': entry['link'],
+                    'provider_publish_time': entry['published'] or now_ts,
+                    'category': 'market'
+                }
+                all_news.append(news_item)
     except Exception as e:
         print(f"ET Market RSS error: {e}")
     
     # Source 5: Business Standard Markets
     try:
-        bs_rss = "https://www.business-standard.com/rss/markets-106.rss"
-        feed = feedparser.parse(bs_rss)
-        
-        if feed and hasattr(feed, 'entries'):
-            for entry in feed.entries[:6]:
-                try:
-                    news_item = {
-                        'title': entry.title,
-                        'publisher': 'Business Standard',
-                        'link': entry.link if hasattr(entry, 'link') else '#',
-                        'provider_publish_time': datetime(*entry.published_parsed[:6]).timestamp() if hasattr(entry, 'published_parsed') else datetime.now().timestamp(),
-                        'category': 'market'
-                    }
-                    all_news.append(news_item)
-                except:
-                    continue
+        entries = feeds['bs_markets'].result()
+        
+        if entries:
+            for entry in entries[:6]:
+                news_item = {
+                    'title': entry['title'],
+                    'publisher': 'Business Standard',
+                    'link': entry['link'],
+                    'provider_publish_time': entry['published'] or now_ts,
+                    'category': 'market'
+                }
+                all_news.append(news_item)
     except Exception as e:
         print(f"Business Standard RSS error: {e}")
     
@@ -1470,41 +1578,50 @@ def get_live_market_news():
         # Sort by publish time (most recent first)
         try:
             all_news.sort(key=lambda x: x.get('provider_publish_time', 0), reverse=True)
-        except:
+        except TypeError:
             pass
         
         # Remove duplicates by title
         unique_news = []
         seen_titles = set()
         for item in all_news:
-            try:
-                if isinstance(item, dict) and 'title' in item:
-                    title_key = item['title'][:60].lower()
-                    if title_key not in seen_titles:
-                        seen_titles.add(title_key)
-                        unique_news.append(item)
-            except:
-                continue
-        
-        return unique_news[:25] if unique_news else generate_fallback_news()
+            title_key = item['title'][:60].lower()
+            if title_key not in seen_titles:
+                seen_titles.add(title_key)
+                unique_news.append(item)
+        
+        unique_news = unique_news[:25]
+        if unique_news:
+            # Format every publish time here in one pass so the page doesn't redo it on every rerun
+            published = pd.to_datetime(
+                [item.get('provider_publish_time') for item in unique_news],
+                unit='s', utc=True, errors='coerce'
+            ).tz_convert(now.astimezone().tzinfo).strftime('%d %b, %H:%M')
+            for item, published_str in zip(unique_news, published):
+                item['published_str'] = published_str if isinstance(published_str, str) else ''
+        
+        return unique_news if unique_news else generate_fallback_news()
     else:
         return generate_fallback_news()
 
 def generate_fallback_news():
     """Generate fallback news when all sources fail"""
+    now = datetime.now()
     return [
         {
             'title': 'Market Dashboard Live - Auto-refreshing every 30 seconds',
             'publisher': 'System',
             'link': '#',
-            'provider_publish_time': datetime.now().timestamp(),
+            'provider_publish_time': now.timestamp(),
+            'published_str': now.strftime('%d %b, %H:%M'),
             'category': 'market'
         },
         {
             'title': 'Loading latest market news... Please wait',
             'publisher': 'System',
             'link': '#',
-            'provider_publish_time': datetime.now().timestamp(),
+            'provider_publish_time': now.timestamp(),
+            'published_str': now.strftime('%d %b, %H:%M'),
             'category': 'market'
         }
     ]
@@ -1515,6 +1632,54 @@ def generate_fallback_news():
 # Includes SUZLON and all 2000+ NSE stocks
 # ========================================
 
+NSE_EQUITY_URL = "https://archives.nseindia.com/content/equities/EQUITY_L.csv"
+NSE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "stock_analysis")
+
+def fetch_nse_equity_csv(session, headers, timeout=20):
+    """
+    EQUITY_L.csv text, kept on disk across restarts.
+    Revalidated with ETag/Last-Modified so an unchanged list costs a 304, not a 2MB download.
+    """
+    csv_path = os.path.join(NSE_CACHE_DIR, "EQUITY_L.csv")
+    meta_path = csv_path + ".meta.json"
+
+    meta = {}
+    if os.path.exists(csv_path):
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = {}
+
+    request_headers = dict(headers)
+    if meta.get('etag'):
+        request_headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        request_headers['If-Modified-Since'] = meta['last_modified']
+
+    response = session.get(NSE_EQUITY_URL, headers=request_headers, timeout=timeout)
+
+    if response.status_code == 304:
+        with open(csv_path, encoding='utf-8') as f:
+            return f.read()
+
+    if response.status_code != 200:
+        print(f"❌ NSE API returned status code: {response.status_code}")
+        raise Exception("Failed to fetch from NSE")
+
+    try:
+        os.makedirs(NSE_CACHE_DIR, exist_ok=True)
+        with open(csv_path, 'w', encoding='utf-8') as f:
+            f.write(response.text)
+        with open(meta_path, 'w') as f:
+            json.dump({'etag': response.headers.get('ETag'),
+                       'last_modified': response.headers.get('Last-Modified')}, f)
+    except OSError as e:
+        print(f"⚠️ Could not write NSE list cache: {e}")
+
+    return response.text
+
+
 def fetch_live_nse_stocks():
     """
     Fetch ALL NSE stocks from NSE India official archive
@@ -1531,28 +1696,23 @@ def fetch_live_nse_stocks():
         
         # Get NSE equity list from official archive
         print("Fetching live NSE stock list from official archives...")
-        url = "https://archives.nseindia.com/content/equities/EQUITY_L.csv"
+        csv_text = fetch_nse_equity_csv(session, headers)
         
-        response = session.get(url, headers=headers, timeout=20)
+        # Only the two columns the list needs, parsed as plain strings
+        csv_data = pd.read_csv(
+            io.StringIO(csv_text), usecols=['SYMBOL', 'NAME OF COMPANY'], dtype=str
+        )
+        symbols = csv_data['SYMBOL'].str.strip()
+        companies = csv_data['NAME OF COMPANY'].str.strip().fillna(symbols)
         
-        if response.status_code == 200:
-            csv_data = pd.read_csv(io.StringIO(response.text))
-            
-            stock_list = []
-            for _, row in csv_data.iterrows():
-                symbol = str(row.get('SYMBOL', '')).strip()
-                company = str(row.get('NAME OF COMPANY', symbol)).strip()
-                
-                # Clean up the data
-                if symbol and symbol != 'SYMBOL' and len(symbol) > 0:
-                    # Format: "SYMBOL - Company Name"
-                    stock_list.append(f"{symbol} - {company}")
-            
-            print(f"✅ Successfully fetched {len(stock_list)} stocks from NSE (including SUZLON)")
-            return sorted(stock_list)
-        else:
-            print(f"❌ NSE API returned status code: {response.status_code}")
-            raise Exception("Failed to fetch from NSE")
+        # Clean up the data
+        valid = symbols.notna() & (symbols != '') & (symbols != 'SYMBOL')
+        
+        # Format: "SYMBOL - Company Name"
+        stock_list = (symbols[valid] + ' - ' + companies[valid]).tolist()
+        
+        print(f"✅ Successfully fetched {len(stock_list)} stocks from NSE (including SUZLON)")
+        return sorted(stock_list)
             
     except Exception as e:
         print(f"❌ Error fetching live NSE data: {e}")
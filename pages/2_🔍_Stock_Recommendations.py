@@ -20,9 +20,20 @@ st.title("🔍 Stock Recommendations")
 st.caption("Search any NSE stock to get intraday and long-term analyst targets")
 st.divider()
 
-for key, default in [('rec_result', None), ('rec_ticker', None), ('rec_time', 0)]:
-    if key not in st.session_state:
-        st.session_state[key] = default
+class RecommendationFailed(Exception):
+    """Carries an error result out of fetch_recommendation so it is never cached"""
+    def __init__(self, result):
+        super().__init__(result.get('error'))
+        self.result = result
+
+@st.cache_data(ttl=120, show_spinner=False)
+def fetch_recommendation(ticker):
+    """Recommendation lookup shared across reruns, sessions and previously viewed tickers"""
+    result = get_stock_recommendation_multi_source(ticker)
+    if result.get('error'):
+        # st.cache_data doesn't store raised calls, so a rate limit isn't replayed to every user
+        raise RecommendationFailed(result)
+    return result, time.time()
 
 if 'all_stocks' not in st.session_state:
     with st.spinner("Loading NSE stock list..."):
@@ -30,6 +41,10 @@ if 'all_stocks' not in st.session_state:
 
 all_stocks = st.session_state.all_stocks
 
+# Lowercased once per session instead of for every stock on every rerun
+if 'all_stocks_lower' not in st.session_state:
+    st.session_state.all_stocks_lower = [s.lower() for s in all_stocks]
+
 # Single search — type to filter, pick from dropdown. No second bar shown until something typed.
 search_text = st.text_input(
     "Search",
@@ -39,7 +54,13 @@ search_text = st.text_input(
 )
 
 query = search_text.strip().lower()
-filtered = [s for s in all_stocks if query in s.lower()] if query else []
+# Reruns from the dropdown or the result view keep the same query, so reuse its matches
+if st.session_state.get('rec_filter_query') != query:
+    st.session_state.rec_filter_query = query
+    st.session_state.rec_filtered = [
+        s for s, s_lower in zip(all_stocks, st.session_state.all_stocks_lower) if query in s_lower
+    ] if query else []
+filtered = st.session_state.rec_filtered
 
 selected_stock = ""
 if query:
@@ -51,10 +72,6 @@ if query:
             label_visibility="collapsed",
             key="rec_select",
         )
-        # Clear old result whenever the dropdown resets to blank (new search started)
-        if not selected_stock and st.session_state.rec_result is not None:
-            st.session_state.rec_result = None
-            st.session_state.rec_ticker = None
     else:
         st.warning("No stocks matched your search. Try a different keyword.")
 else:
@@ -63,20 +80,13 @@ else:
 if selected_stock:
     ticker_input = selected_stock.split(" - ")[0].strip()
     current_time = time.time()
-    use_cache = (
-        st.session_state.rec_ticker == ticker_input
-        and st.session_state.rec_result is not None
-        and (current_time - st.session_state.rec_time) < 120
-    )
-
-    if not use_cache:
-        with st.spinner(f"Fetching recommendations for {ticker_input}..."):
-            result = get_stock_recommendation_multi_source(ticker_input)
-            st.session_state.rec_result = result
-            st.session_state.rec_ticker = ticker_input
-            st.session_state.rec_time = current_time
-    else:
-        result = st.session_state.rec_result
+    with st.spinner(f"Fetching recommendations for {ticker_input}..."):
+        try:
+            result, fetched_at = fetch_recommendation(ticker_input)
+        except RecommendationFailed as e:
+            result, fetched_at = e.result, current_time
+
+    if fetched_at < current_time:
         st.info("📌 Showing cached data (auto-refreshes every 2 minutes)")
 
     if result.get('error'):
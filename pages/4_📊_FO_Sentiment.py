@@ -45,6 +45,8 @@ NSE_HEADERS = {
 }
 
 # 2. Enhanced Session Generator to bypass weekend/holiday bot blocks
+# Shared for a few minutes so fetches reuse the warmed cookies and open connections
+@st.cache_resource(ttl=300, show_spinner=False)
 def nse_session():
     s = requests.Session()
     s.headers.update(NSE_HEADERS)
@@ -82,16 +84,16 @@ def fetch_fii_dii():
 @st.cache_data(ttl=86400) 
 def fetch_fno_mapping():
     try:
-        df = pd.read_csv("https://api.kite.trade/instruments")
+        # Only three of the instrument dump's columns are needed; skip parsing the rest
+        df = pd.read_csv("https://api.kite.trade/instruments",
+                         usecols=['tradingsymbol', 'name', 'segment'], dtype=str)
         
-        fno_underlyings = set(df[df['segment'] == 'NFO-FUT']['name'].dropna().unique())
+        fno_underlyings = df.loc[df['segment'] == 'NFO-FUT', 'name'].dropna().unique()
         
-        nse_df = df[df['segment'] == 'NSE'][['tradingsymbol', 'name']].dropna()
+        nse_df = df.loc[df['segment'] == 'NSE', ['tradingsymbol', 'name']].dropna()
         fno_df = nse_df[nse_df['tradingsymbol'].isin(fno_underlyings)]
         
-        mapping = []
-        for _, row in fno_df.iterrows():
-            mapping.append(f"{row['tradingsymbol']} - {row['name']}")
+        mapping = (fno_df['tradingsymbol'] + ' - ' + fno_df['name']).tolist()
             
         # 3. Explicitly adding Indian Indices
         indices = [
@@ -123,7 +125,9 @@ def fetch_option_chain(symbol):
         
         # Retry mechanism if unauthorized or blocked initially
         if r.status_code in [401, 403]:
-            s = nse_session() 
+            # Cookies expired: drop the shared session and warm up a fresh one
+            nse_session.clear()
+            s = nse_session()
             r = s.get(url, timeout=15)
 
         if r.status_code == 200:
@@ -195,12 +199,14 @@ elif not fii_df.empty:
     sell_col   = next((c for c in cols if 'sell' in c.lower()), None)
     net_col    = next((c for c in cols if 'net' in c.lower()), None)
 
-    for c in [buy_col, sell_col, net_col]:
-        if c and c in fii_df.columns:
-            fii_df[c] = pd.to_numeric(
-                fii_df[c].astype(str).str.replace(',', '').str.replace('(', '-').str.replace(')', ''),
-                errors='coerce'
-            )
+    # Strip thousands separators and turn "(123)" into "-123" across all value columns at once
+    num_cols = list(dict.fromkeys(c for c in [buy_col, sell_col, net_col] if c))
+    if num_cols:
+        fii_df[num_cols] = (
+            fii_df[num_cols].astype(str)
+            .replace({',': '', r'\(': '-', r'\)': ''}, regex=True)
+            .apply(pd.to_numeric, errors='coerce')
+        )
 
     if date_col:
         fii_df[date_col] = pd.to_datetime(fii_df[date_col], errors='coerce')
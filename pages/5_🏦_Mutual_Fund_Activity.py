@@ -42,6 +42,9 @@ def fetch_all_schemes():
                 df.columns = ['schemeCode', 'schemeName']
             df['schemeCode'] = df['schemeCode'].astype(str)
             df['schemeName'] = df['schemeName'].astype(str)
+            # Built once per fetch instead of on every keystroke in the scheme search
+            df['nameLower'] = df['schemeName'].str.lower()
+            df['display'] = df['schemeCode'] + " — " + df['schemeName']
             return df, None
         return pd.DataFrame(), f"API returned {r.status_code}"
     except Exception as e:
@@ -65,6 +68,8 @@ def fetch_nav(code):
     except Exception as e:
         return pd.DataFrame(), {}, str(e)
 
+# Shared for a few minutes so fetches reuse the warmed cookies and open connections
+@st.cache_resource(ttl=300, show_spinner=False)
 def nse_session():
     s = requests.Session()
     s.headers.update(NSE_HEADERS)
@@ -74,15 +79,23 @@ def nse_session():
         pass
     return s
 
+def nse_get(url, timeout=15):
+    """GET through the shared NSE session, re-warming it once if NSE rejects its cookies"""
+    r = nse_session().get(url, timeout=timeout)
+    if r.status_code in [401, 403]:
+        # Cookies expired: drop the shared session and warm up a fresh one
+        nse_session.clear()
+        r = nse_session().get(url, timeout=timeout)
+    return r
+
 @st.cache_data(ttl=1800, show_spinner=False)
 def fetch_stock_bulk_deals(symbol, days=90):
-    s = nse_session()
     today = datetime.now()
     from_d = (today - timedelta(days=days)).strftime("%d-%m-%Y")
     to_d = today.strftime("%d-%m-%Y")
     url = f"https://www.nseindia.com/api/historical/bulk-deals?from={from_d}&to={to_d}&symbol={symbol.upper()}"
     try:
-        r = s.get(url, timeout=15)
+        r = nse_get(url)
         if r.status_code == 200:
             deals = r.json().get('data', [])
             if deals:
@@ -114,30 +127,51 @@ def fetch_stock_bulk_deals(symbol, days=90):
 @st.cache_data(ttl=1800, show_spinner=False)
 def fetch_shareholding(symbol):
     """Fetch shareholding pattern using NSE equity API."""
-    s = nse_session()
     # Correct NSE shareholding endpoint
     url = f"https://www.nseindia.com/api/corporate-shareholding-patterns?index=equities&symbol={symbol.upper()}"
     try:
-        r = s.get(url, timeout=15)
+        r = nse_get(url)
         if r.status_code == 200:
             data = r.json()
             return data, None
         # Try alternate
         url2 = f"https://www.nseindia.com/api/shareholdingPatterns?index=equities&symbol={symbol.upper()}"
-        r2 = s.get(url2, timeout=15)
+        r2 = nse_get(url2)
         if r2.status_code == 200:
             return r2.json(), None
         return None, f"NSE returned {r.status_code}"
     except Exception as e:
         return None, str(e)
 
-def fmt_qty(x):
-    try: return f"{int(x):,}"
-    except: return '-'
+# Quantity/price stay numeric so the deal tables sort correctly
+DEAL_COLUMNS = {
+    'Quantity': st.column_config.NumberColumn(format="%,.0f"),
+    'Price (₹)': st.column_config.NumberColumn(format="₹ %,.2f"),
+}
 
-def fmt_price(x):
-    try: return f"₹{float(x):,.2f}"
-    except: return '-'
+@st.fragment
+def render_nav_chart(nav_df):
+    """NAV chart with its own period picker; changing the period reruns only this block."""
+    period = st.selectbox("Period", ["1 Month","3 Months","6 Months","1 Year"],
+                          index=1, key="nav_period")
+    days_map = {"1 Month":30,"3 Months":90,"6 Months":180,"1 Year":365}
+    plot_df = nav_df.tail(days_map[period])
+    fig = go.Figure()
+    fig.add_scatter(
+        x=plot_df['date'], y=plot_df['nav'],
+        mode='lines', line=dict(color='#00b4d8', width=2),
+        fill='tozeroy', fillcolor='rgba(0,180,216,0.08)',
+    )
+    fig.update_layout(
+        title=f"NAV — {period}",
+        height=340,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font_color='white',
+        xaxis_title='', yaxis_title='NAV (₹)',
+        margin=dict(l=0,r=0,t=40,b=0),
+    )
+    st.plotly_chart(fig, use_container_width=True)
 
 # ── Tabs ──────────────────────────────────────────────────────────────────────
 tab1, tab2, tab3 = st.tabs(["📈 MF Scheme NAV", "🔍 Stock-wise MF Deals", "📋 Shareholding Pattern"])
@@ -163,14 +197,11 @@ with tab1:
 
         q = mf_search.strip().lower()
         if q and not schemes_df.empty:
-            filtered = schemes_df[schemes_df['schemeName'].str.lower().str.contains(q, na=False)]
+            filtered = schemes_df[schemes_df['nameLower'].str.contains(q, regex=False)]
             if filtered.empty:
                 st.info("No schemes matched. Try shorter keywords (e.g. 'SBI' or 'Bluechip').")
             else:
-                options = [""] + [
-                    f"{row['schemeCode']} — {row['schemeName']}"
-                    for _, row in filtered.head(80).iterrows()
-                ]
+                options = [""] + filtered['display'].head(80).tolist()
                 sel = st.selectbox(
                     "Select scheme",
                     options=options,
@@ -202,26 +233,7 @@ with tab1:
                                 st.metric("1-Day Δ", f"{pct:+.2f}%")
 
                         if not nav_df.empty:
-                            period = st.selectbox("Period", ["1 Month","3 Months","6 Months","1 Year"],
-                                                  index=1, key="nav_period")
-                            days_map = {"1 Month":30,"3 Months":90,"6 Months":180,"1 Year":365}
-                            plot_df = nav_df.tail(days_map[period])
-                            fig = go.Figure()
-                            fig.add_scatter(
-                                x=plot_df['date'], y=plot_df['nav'],
-                                mode='lines', line=dict(color='#00b4d8', width=2),
-                                fill='tozeroy', fillcolor='rgba(0,180,216,0.08)',
-                            )
-                            fig.update_layout(
-                                title=f"NAV — {period}",
-                                height=340,
-                                paper_bgcolor='rgba(0,0,0,0)',
-                                plot_bgcolor='rgba(0,0,0,0)',
-                                font_color='white',
-                                xaxis_title='', yaxis_title='NAV (₹)',
-                                margin=dict(l=0,r=0,t=40,b=0),
-                            )
-                            st.plotly_chart(fig, use_container_width=True)
+                            render_nav_chart(nav_df)
         else:
             st.info("💡 Type a fund name above to search — e.g. 'SBI', 'HDFC', 'Nippon Small Cap'")
 
@@ -261,23 +273,15 @@ with tab2:
         else:
             st.markdown(f"##### 🏦 Mutual Fund Deals — {mf_sel_stock}")
             if not mf_df.empty:
-                show = mf_df.copy()
-                if 'Quantity' in show.columns:
-                    show['Quantity'] = show['Quantity'].apply(fmt_qty)
-                if 'Price (₹)' in show.columns:
-                    show['Price (₹)'] = show['Price (₹)'].apply(fmt_price)
-                st.dataframe(show.reset_index(drop=True), use_container_width=True)
+                st.dataframe(mf_df.reset_index(drop=True), use_container_width=True,
+                             column_config=DEAL_COLUMNS)
             else:
                 st.info(f"No mutual fund bulk deals found for **{mf_sel_stock}** in the last 90 days.")
 
             if not all_df.empty:
                 with st.expander(f"📦 All Bulk Deals for {mf_sel_stock} (90 days)"):
-                    show2 = all_df.copy()
-                    if 'Quantity' in show2.columns:
-                        show2['Quantity'] = show2['Quantity'].apply(fmt_qty)
-                    if 'Price (₹)' in show2.columns:
-                        show2['Price (₹)'] = show2['Price (₹)'].apply(fmt_price)
-                    st.dataframe(show2.head(20).reset_index(drop=True), use_container_width=True)
+                    st.dataframe(all_df.head(20).reset_index(drop=True), use_container_width=True,
+                                 column_config=DEAL_COLUMNS)
     else:
         st.info("💡 Type or select a stock above to see MF bulk deal activity")
 
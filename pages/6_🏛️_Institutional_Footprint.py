@@ -5,8 +5,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import streamlit as st
 import requests
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 
 st.set_page_config(page_title="Institutional Footprint", layout="wide", page_icon="🏛️")
 
@@ -31,7 +33,6 @@ NSE_HEADERS = {
 }
 
 # ── Data fetchers ──────────────────────────────────────────────────────────────
-@st.cache_data(ttl=600)
 def fetch_stock_delivery(symbol):
     """Fetch delivery percentage and volume data from NSE equity history."""
     session = requests.Session()
@@ -63,7 +64,8 @@ def fetch_stock_delivery(symbol):
                     'CH_TRADE_HIGH_PRICE': 'High',
                     'CH_TRADE_LOW_PRICE': 'Low',
                 }
-                df = df.rename(columns={k: v for k, v in col_map.items() if k in df.columns})
+                # Keep only the mapped columns so the cached frame doesn't carry NSE's other fields
+                df = df[[k for k in col_map if k in df.columns]].rename(columns=col_map)
                 for col in ['Close', 'Volume', 'Delivery Qty', 'Delivery %', 'Open', 'High', 'Low']:
                     if col in df.columns:
                         df[col] = pd.to_numeric(df[col], errors='coerce')
@@ -76,7 +78,6 @@ def fetch_stock_delivery(symbol):
     except Exception as e:
         return pd.DataFrame(), str(e)
 
-@st.cache_data(ttl=1800)
 def fetch_institutional_bulk_history(symbol, days=90):
     """Fetch all bulk/block deals for a stock over past N days."""
     session = requests.Session()
@@ -108,6 +109,16 @@ def fetch_institutional_bulk_history(symbol, days=90):
         return df, None
     return pd.DataFrame(), f"No bulk/block deals found for {symbol} in last {days} days."
 
+# The two per-stock fetchers above are plain functions so they can run in worker threads,
+# which have no ScriptRunContext; the combined result is cached here on the script thread.
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_stock_footprint(symbol):
+    """Delivery history and institutional deals for one stock, fetched concurrently."""
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        delivery = ex.submit(fetch_stock_delivery, symbol)
+        deals = ex.submit(fetch_institutional_bulk_history, symbol)
+        return delivery.result(), deals.result()
+
 @st.cache_data(ttl=1800)
 def fetch_top_delivery_stocks():
     """Fetch top stocks by delivery % from NSE (institutional buying proxy)."""
@@ -192,14 +203,15 @@ search_inst = st.text_input(
 if search_inst.strip():
     sym = search_inst.strip().upper()
 
+    with st.spinner(f"Fetching delivery data and institutional deals for {sym}..."):
+        (del_df, del_err), (inst_df, inst_err) = fetch_stock_footprint(sym)
+
     col_del, col_bulk = st.columns([3, 2])
 
     # ── Delivery % Analysis ──────────────────────────────────────────────────
     with col_del:
         st.markdown(f"#### 📦 Delivery % — {sym}")
         st.caption("Delivery > 60% on high volume = strong institutional participation")
-        with st.spinner("Fetching delivery data..."):
-            del_df, del_err = fetch_stock_delivery(sym)
 
         if del_err and del_df.empty:
             st.warning(f"⚠️ {del_err}")
@@ -231,12 +243,10 @@ if search_inst.strip():
             # Delivery % chart
             fig_del = go.Figure()
             if 'Date' in del_df.columns:
+                deliv = del_df['Delivery %'].to_numpy()
                 fig_del.add_bar(
-                    x=del_df['Date'], y=del_df['Delivery %'],
-                    marker_color=[
-                        '#00c853' if v >= 60 else '#ffd600' if v >= 40 else '#9e9e9e'
-                        for v in del_df['Delivery %']
-                    ],
+                    x=del_df['Date'], y=deliv,
+                    marker_color=np.select([deliv >= 60, deliv >= 40], ['#00c853', '#ffd600'], '#9e9e9e'),
                     name='Delivery %'
                 )
                 fig_del.add_hline(y=60, line_dash='dash', line_color='#00c853',
@@ -275,8 +285,6 @@ if search_inst.strip():
     with col_bulk:
         st.markdown(f"#### 🏦 Institutional Deals — {sym} (Last 90 Days)")
         st.caption("All bulk & block deals involving large entities")
-        with st.spinner("Fetching institutional deals..."):
-            inst_df, inst_err = fetch_institutional_bulk_history(sym)
 
         if inst_err and inst_df.empty:
             st.warning(f"⚠️ {inst_err}")
@@ -288,15 +296,19 @@ if search_inst.strip():
             }
             show_df = inst_df.rename(columns={k: v for k, v in rename.items() if k in inst_df.columns})
 
-            if 'Qty' in show_df.columns:
-                show_df['Qty'] = pd.to_numeric(show_df['Qty'], errors='coerce').apply(
-                    lambda x: f"{int(x):,}" if pd.notna(x) else '-')
-            if 'Price (₹)' in show_df.columns:
-                show_df['Price (₹)'] = pd.to_numeric(show_df['Price (₹)'], errors='coerce').apply(
-                    lambda x: f"₹{x:,.2f}" if pd.notna(x) else '-')
+            for c in ('Qty', 'Price (₹)'):
+                if c in show_df.columns:
+                    show_df[c] = pd.to_numeric(show_df[c], errors='coerce')
 
             display_cols = [c for c in ['Date', 'Entity', 'Buy/Sell', 'Qty', 'Price (₹)', 'Deal Kind'] if c in show_df.columns]
-            st.dataframe(show_df[display_cols].head(20).reset_index(drop=True), use_container_width=True)
+            st.dataframe(
+                show_df[display_cols].head(20).reset_index(drop=True),
+                use_container_width=True,
+                column_config={
+                    'Qty': st.column_config.NumberColumn(format="%,.0f"),
+                    'Price (₹)': st.column_config.NumberColumn(format="₹ %,.2f"),
+                },
+            )
 
             # Buy vs Sell breakdown
             if 'Buy/Sell' in show_df.columns:
@@ -339,26 +351,29 @@ else:
 
         if date_col and (fii_net_col or dii_net_col):
             fii_trend_df[date_col] = pd.to_datetime(fii_trend_df[date_col], errors='coerce')
-            if fii_net_col:
-                fii_trend_df[fii_net_col] = pd.to_numeric(
-                    fii_trend_df[fii_net_col].astype(str).str.replace(',', ''), errors='coerce')
-            if dii_net_col:
-                fii_trend_df[dii_net_col] = pd.to_numeric(
-                    fii_trend_df[dii_net_col].astype(str).str.replace(',', ''), errors='coerce')
+            net_cols = [c for c in (fii_net_col, dii_net_col) if c]
+            fii_trend_df[net_cols] = (
+                fii_trend_df[net_cols].astype(str)
+                .replace(',', '', regex=True)
+                .apply(pd.to_numeric, errors='coerce')
+            )
 
             fig_flow = go.Figure()
-            if fii_net_col:
-                fig_flow.add_bar(
-                    x=fii_trend_df[date_col], y=fii_trend_df[fii_net_col],
-                    name='FII Net',
-                    marker_color=[('#00c853' if v >= 0 else '#ff5252') for v in fii_trend_df[fii_net_col].fillna(0)]
-                )
-            if dii_net_col:
-                fig_flow.add_bar(
-                    x=fii_trend_df[date_col], y=fii_trend_df[dii_net_col],
-                    name='DII Net',
-                    marker_color=[('#00b4d8' if v >= 0 else '#ff9800') for v in fii_trend_df[dii_net_col].fillna(0)]
-                )
+            dates = fii_trend_df[date_col].to_numpy()
+            has_date = fii_trend_df[date_col].notna().to_numpy()
+            for net_col, name, up, down in [(fii_net_col, 'FII Net', '#00c853', '#ff5252'),
+                                            (dii_net_col, 'DII Net', '#00b4d8', '#ff9800')]:
+                if not net_col:
+                    continue
+                # Unparseable rows would only be empty bars, so drop them before serialising
+                net = fii_trend_df[net_col].to_numpy(dtype=float)
+                keep = has_date & ~np.isnan(net)
+                if keep.any():
+                    fig_flow.add_bar(
+                        x=dates[keep], y=net[keep],
+                        name=name,
+                        marker_color=np.where(net[keep] >= 0, up, down),
+                    )
 
             fig_flow.add_hline(y=0, line_color='white', line_width=0.8)
             fig_flow.update_layout(